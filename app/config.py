@@ -2,7 +2,10 @@ import os
 from dotenv import load_dotenv
 
 def load_config(app):
-    load_dotenv("/opt/<app>/.env")
+    # systemd EnvironmentFile 已注入環境變數時（可設 APP_ENV_LOADED=1），或同一 process 已讀過一次，就不再讀 .env
+    if not os.getenv("APP_ENV_LOADED"):
+        load_dotenv("/opt/<app>/.env", override=False)
+        os.environ["APP_ENV_LOADED"] = "1"
 
     # Project paths
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -17,6 +20,12 @@ def load_config(app):
     app.config["ADMIN_TOKEN"] = os.getenv("ADMIN_TOKEN", "")
     app.config["APP_CODE"] = os.getenv("APP_CODE")
     app.config["APP_TRADE_NO_PREFIX"] = os.getenv("APP_TRADE_NO_PREFIX", "CT")
+    # MerchantTradeNo 只允許 ASCII 英數字（isalnum 會放行中文 / 全形字，需另加 isascii）
+    # prefix 在 process 內固定，這裡先清理好（最多 4 碼，清完為空則用 CT）
+    # 供之後的 gen_merchant_trade_no 使用（目前尚無呼叫端）
+    app.config["APP_TRADE_NO_PREFIX_SAFE"] = "".join(
+        c for c in app.config["APP_TRADE_NO_PREFIX"] if c.isascii() and c.isalnum()
+    )[:4] or "CT"
 
     # === ECpay variables ===
     app.config["ECPAY_MERCHANT_ID"] = os.getenv("ECPAY_MERCHANT_ID")
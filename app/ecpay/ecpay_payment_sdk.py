@@ -1,11 +1,11 @@
 # coding: utf-8
-import collections
 import hashlib
-import copy
+import hmac
 import requests
 import json
 import pprint
 from decimal import Decimal
+from markupsafe import escape
 from urllib.parse import quote_plus, parse_qsl, parse_qs
 
 """
@@ -254,37 +254,32 @@ class BasePayment(object):
                         del parameters[k]
 
     def generate_check_value(self, params):
-        _params = copy.deepcopy(params)
+        # 只會移除 / 覆寫 key，不會改動 value，淺拷貝即可
+        _params = dict(params)
 
         if _params.get('CheckMacValue'):
             _params.pop('CheckMacValue')
 
         encrypt_type = int(_params.get('EncryptType', 1))
 
-        _params.update({'MerchantID': self.MerchantID})
+        _params['MerchantID'] = self.MerchantID
 
-        ordered_params = collections.OrderedDict(
-            sorted(_params.items(), key=lambda k: k[0].lower()))
-
-        encoding_lst = []
-        encoding_lst.append('HashKey=%s&' % self.HashKey)
-        encoding_lst.append(''.join(
-            ['{}={}&'.format(key, value) for key, value in ordered_params.items()]))
-        encoding_lst.append('HashIV=%s' % self.HashIV)
+        encoding_str = 'HashKey=%s&%s&HashIV=%s' % (
+            self.HashKey,
+            '&'.join('%s=%s' % (key, value) for key, value in
+                     sorted(_params.items(), key=lambda k: k[0].lower())),
+            self.HashIV)
 
         safe_characters = '-_.!*()'
 
-        encoding_str = ''.join(encoding_lst)
         encoding_str = quote_plus(
-            str(encoding_str), safe=safe_characters).lower()
+            encoding_str, safe=safe_characters).lower().encode('utf-8')
 
         check_mac_value = ''
         if encrypt_type == 1:
-            check_mac_value = hashlib.sha256(
-                encoding_str.encode('utf-8')).hexdigest().upper()
+            check_mac_value = hashlib.sha256(encoding_str).hexdigest().upper()
         elif encrypt_type == 0:
-            check_mac_value = hashlib.md5(
-                encoding_str.encode('utf-8')).hexdigest().upper()
+            check_mac_value = hashlib.md5(encoding_str).hexdigest().upper()
 
         return check_mac_value
 
@@ -307,10 +302,11 @@ class BasePayment(object):
 class ExtendFunction(BasePayment):
 
     def gen_html_post_form(self, action, parameters):
-        html = '<form id="data_set" action="' + action + '" method="post">'
-        for k, v in parameters.items():
-            html += '<input type="hidden" name="' + \
-                str(k) + '" value="' + str(v) + '" />'
+        # action / 參數值可能含使用者輸入（例如 ItemName），一律 HTML escape
+        html = '<form id="data_set" action="%s" method="post">' % escape(action)
+        html += ''.join(
+            '<input type="hidden" name="%s" value="%s" />' % (escape(k), escape(v))
+            for k, v in parameters.items())
 
         html += '<script type="text/javascript">document.getElementById("data_set").submit();</script>'
         html += "</form>"
@@ -630,7 +626,8 @@ class OrderSearch(BasePayment):
         response = super().send_post(
             action_url, self.final_merge_parameters)
         query = dict(parse_qsl(response.text, keep_blank_values=True))
-        if query.get('CheckMacValue') == self.generate_check_value(query):
+        if hmac.compare_digest((query.get('CheckMacValue') or '').encode(),
+                               self.generate_check_value(query).encode()):
             query.pop('CheckMacValue')
             return query
         else:
@@ -1,7 +1,7 @@
 # /app/models.py
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 from .extensions import db
@@ -11,7 +11,7 @@ def utcnow() -> datetime:
     """
     一律使用 naive UTC，避免 SQLite/SQLAlchemy 常見的 aware/naive datetime 比較錯誤。
     """
-    return datetime.utcnow()
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class Order(db.Model):
@@ -55,12 +55,19 @@ class Order(db.Model):
         # 以 ReturnURL 背景通知為主 + CheckMacValue 通過
         return self.status == "paid" and bool(self.checkmac_valid)
 
+    # 反向查詢維持 lazy="select"，避免 order_result 這類只需要訂單的查詢被 token JOIN 拖大
+    download_tokens = db.relationship("DownloadToken", back_populates="order", lazy="select")
+
 
 class DownloadToken(db.Model):
     __tablename__ = "download_tokens"
+    __table_args__ = (
+        # 「某訂單最新的 token」：WHERE order_id = ? ORDER BY created_at DESC 直接走索引，不用另外排序
+        db.Index("ix_download_tokens_order_created", "order_id", "created_at"),
+    )
 
     token = db.Column(db.String(128), primary_key=True)
-    order_id = db.Column(db.Integer, db.ForeignKey("orders.id"), nullable=False, index=True)
+    order_id = db.Column(db.Integer, db.ForeignKey("orders.id"), nullable=False)
 
     # 若你的 app 有產出檔案（例如 DOCX），放絕對路徑在這裡
     file_path = db.Column(db.Text, nullable=False)
@@ -68,4 +75,5 @@ class DownloadToken(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, default=utcnow)
     expires_at = db.Column(db.DateTime, nullable=False)
 
-    order = db.relationship("Order", backref=db.backref("download_tokens", lazy=True))
+    # 拿到 token 幾乎一定會用到訂單（下載前要檢查付款狀態），直接 JOIN 一次取回
+    order = db.relationship("Order", back_populates="download_tokens", lazy="joined")
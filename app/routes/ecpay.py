@@ -1,10 +1,22 @@
 # /opt/form/app/routes/ecpay.py
 from __future__ import annotations
 
-from flask import Blueprint, Response, current_app
+from flask import Blueprint, Response, current_app, request
 
 ecpay_bp = Blueprint("ecpay", __name__, url_prefix="/ecpay")
 
+# 付款結果 / 下載內容因人而異，不可被瀏覽器或反向代理 / CDN 快取
+# 以 endpoint 比對，不受 blueprint 掛載的 url_prefix 影響（ecpay.download 尚未實作，先列入）
+_NO_STORE_ENDPOINTS = frozenset({"ecpay.order_result", "ecpay.download"})
+
+
+@ecpay_bp.after_request
+def _no_store_payment_pages(response: Response) -> Response:
+    if request.endpoint in _NO_STORE_ENDPOINTS:
+        response.headers["Cache-Control"] = "no-store, private"
+        response.headers["Pragma"] = "no-cache"
+    return response
+
 
 @ecpay_bp.get("/health")
 def health():
@@ -0,0 +1,22 @@
+# /tests/test_config.py
+import pytest
+from flask import Flask
+
+from app.config import load_config
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("a-b_c!de", "abcd"),
+        ("--", "CT"),
+        ("台北", "CT"),
+        ("ＡＢ１", "CT"),
+        ("", "CT"),
+    ],
+)
+def test_trade_no_prefix_is_sanitized_to_ascii_alnum(monkeypatch, raw, expected):
+    monkeypatch.setenv("APP_TRADE_NO_PREFIX", raw)
+    app = Flask(__name__)
+    load_config(app)
+    assert app.config["APP_TRADE_NO_PREFIX_SAFE"] == expected
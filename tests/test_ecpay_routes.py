@@ -0,0 +1,25 @@
+# /tests/test_ecpay_routes.py
+import pytest
+from flask import Flask
+
+from app.routes.ecpay import ecpay_bp
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(ecpay_bp)
+    return app.test_client()
+
+
+def test_order_result_is_not_cacheable(client):
+    resp = client.get("/ecpay/order_result")
+    assert resp.headers["Cache-Control"] == "no-store, private"
+    assert resp.headers["Pragma"] == "no-cache"
+
+
+@pytest.mark.parametrize("path", ["/ecpay/health", "/ecpay/create"])
+def test_other_endpoints_keep_default_cache_headers(client, path):
+    resp = client.get(path)
+    assert "Cache-Control" not in resp.headers
+    assert "Pragma" not in resp.headers
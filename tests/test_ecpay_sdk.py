@@ -0,0 +1,55 @@
+# /tests/test_ecpay_sdk.py
+from app.ecpay.ecpay_payment_sdk import ECPayPaymentSdk
+
+# 綠界官方文件 CheckMacValue 範例（測試商店 3002607）
+MERCHANT_ID = "3002607"
+HASH_KEY = "pwFHCqoQZGmho4w6"
+HASH_IV = "EkRm7iFT261dpevs"
+
+DOC_PARAMS = {
+    "TradeDesc": "促銷方案",
+    "PaymentType": "aio",
+    "MerchantTradeDate": "2023/03/12 15:30:23",
+    "MerchantTradeNo": "ecpay20230312153023",
+    "MerchantID": MERCHANT_ID,
+    "ReturnURL": "https://www.ecpay.com.tw/receive.php",
+    "ItemName": "Apple iphone 15",
+    "TotalAmount": "30000",
+    "ChoosePayment": "ALL",
+}
+
+
+def _sdk() -> ECPayPaymentSdk:
+    return ECPayPaymentSdk(MerchantID=MERCHANT_ID, HashKey=HASH_KEY, HashIV=HASH_IV)
+
+
+def test_check_value_sha256_matches_doc_example():
+    params = dict(DOC_PARAMS, EncryptType="1")
+    assert _sdk().generate_check_value(params) == (
+        "6C51C9E6888DE861FD62FB1DD17029FC742634498FD813DC43D4243B5685B840"
+    )
+
+
+def test_check_value_md5():
+    params = dict(DOC_PARAMS, EncryptType="0")
+    assert _sdk().generate_check_value(params) == "9010026CCC3DC8763B11F5EFEA6D6420"
+
+
+def test_check_value_ignores_incoming_check_mac_value():
+    params = dict(DOC_PARAMS, EncryptType="1")
+    signed = dict(params, CheckMacValue="0" * 64)
+    assert _sdk().generate_check_value(signed) == _sdk().generate_check_value(params)
+    # 呼叫端傳入的 dict 不可被修改
+    assert signed["CheckMacValue"] == "0" * 64
+
+
+def test_html_post_form_escapes_action_and_values():
+    html = _sdk().gen_html_post_form(
+        'https://example.com/pay?a=1&b="2"',
+        {"ItemName": 'x" onfocus="<script>&', "TotalAmount": 30000},
+    )
+    assert 'action="https://example.com/pay?a=1&amp;b=&#34;2&#34;"' in html
+    assert 'name="ItemName" value="x&#34; onfocus=&#34;&lt;script&gt;&amp;"' in html
+    # 非 str 的值仍要正常輸出
+    assert 'name="TotalAmount" value="30000"' in html
+    assert "<script>&" not in html